@@ -27,9 +27,25 @@ from __future__ import annotations
 import os
 import asyncio
 import logging
+import string
+import sys
+from typing import TYPE_CHECKING
 from dotenv import load_dotenv
-import json
-from typing import Any
+
+# Use uvloop's faster event loop when it is installed (Linux/macOS only).
+# The worker and its job processes create their loops after this import.
+try:
+    import uvloop
+
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+except ImportError:
+    pass
+
+# Typed, validating decoder for the dispatch metadata
+import msgspec
+
+# Memoization for async lookups (availability, etc.)
+from async_lru import alru_cache
 
 # LiveKit core imports for real-time communication and API access
 from livekit import rtc, api
@@ -39,6 +55,7 @@ from livekit.agents import (
     AgentSession,  # Manages the conversation session
     Agent,  # Base class for creating agents
     JobContext,  # Provides context about the current job/call
+    JobProcess,  # Worker process that runs jobs (used for prewarming)
     function_tool,  # Decorator for creating callable functions
     RunContext,  # Context during function execution
     get_job_context,  # Access to current job context
@@ -47,17 +64,19 @@ from livekit.agents import (
     RoomInputOptions,  # Configuration for room audio input
 )
 
-# LiveKit plugins for various AI services
-from livekit.plugins import (
-    anthropic,  # Claude AI (Primary LLM)  # type: ignore[attr-defined]
-    deepgram,   # Speech-to-text
-    cartesia,   # Text-to-speech
-    silero,     # Voice activity detection
-    noise_cancellation,  # Background noise removal
-    openai,     # OpenAI Realtime API (works without inference executor)
-)
+# LiveKit plugins are not imported here. noise_cancellation and openai (Realtime
+# API) are imported in prewarm() and where they are used, so the worker's
+# supervisor process never loads them; every job process still does, in
+# prewarm, so a call doesn't pay for the import before dialing. The Claude
+# pipeline plugins (anthropic, deepgram, cartesia, silero) are only needed if
+# the commented-out pipeline session below is switched back on.
 # from livekit.plugins.turn_detector.english import EnglishModel  # Turn detection - causes WSL2 timeout
 
+if TYPE_CHECKING:
+    # Only imported lazily at runtime (asyncpg only when APPT_DB_DSN is set)
+    import asyncpg
+    from livekit.plugins import openai
+
 # Load environment variables from .env.local file
 # This includes API keys, LiveKit credentials, and SIP trunk configuration
 load_dotenv(dotenv_path=".env.local")
@@ -66,9 +85,440 @@ load_dotenv(dotenv_path=".env.local")
 logger = logging.getLogger("outbound-caller")
 logger.setLevel(logging.INFO)
 
-# SIP trunk ID for making outbound calls via LiveKit
-# This is configured in your LiveKit dashboard and connects to Twilio
-outbound_trunk_id = os.getenv("SIP_OUTBOUND_TRUNK_ID")
+
+class Settings(msgspec.Struct, frozen=True):
+    """
+    Agent configuration, read from the environment once at import.
+
+    Attributes:
+        sip_outbound_trunk_id: SIP trunk ID for making outbound calls via LiveKit.
+            This is configured in your LiveKit dashboard and connects to Twilio.
+        openai_api_key: OpenAI API key for the Realtime API
+        appt_db_dsn: Postgres DSN for availability lookups (optional)
+        mock_availability: Return mock availability even if a database is configured
+    """
+
+    sip_outbound_trunk_id: str | None
+    openai_api_key: str | None
+    appt_db_dsn: str | None
+    mock_availability: bool
+
+
+def _load_settings() -> Settings:
+    """Read the agent settings from the environment (after load_dotenv)."""
+    return Settings(
+        sip_outbound_trunk_id=os.getenv("SIP_OUTBOUND_TRUNK_ID"),
+        openai_api_key=os.getenv("OPENAI_API_KEY"),
+        appt_db_dsn=os.getenv("APPT_DB_DSN"),
+        mock_availability=os.getenv("MOCK_AVAILABILITY") == "1",
+    )
+
+
+def _check_settings() -> None:
+    """
+    Fail fast when required settings are missing.
+
+    Raises:
+        ValueError: If SIP_OUTBOUND_TRUNK_ID or OPENAI_API_KEY is not set
+    """
+    missing = [
+        var
+        for var, value in (
+            ("SIP_OUTBOUND_TRUNK_ID", SETTINGS.sip_outbound_trunk_id),
+            ("OPENAI_API_KEY", SETTINGS.openai_api_key),
+        )
+        if not value
+    ]
+    if missing:
+        raise ValueError(f"{', '.join(missing)} must be set in .env.local")
+
+
+SETTINGS = _load_settings()
+
+
+class DialInfo(msgspec.Struct, frozen=True, gc=False):
+    """
+    Call information passed as JSON metadata when the job is dispatched.
+
+    Attributes:
+        phone_number: Number to call (E.164 format)
+        transfer_to: Human agent number for transfers, if any
+        name: Prospect's first name, injected per row by dispatch_from_excel.py
+
+    Frozen and untracked by the garbage collector: it only holds strings and
+    is never modified after decoding.
+    """
+
+    phone_number: str
+    transfer_to: str | None = None
+    name: str = "there"
+
+
+# Realtime model for the call this job process will handle. Job processes are
+# single-use, so this is never shared between calls; prewarm() builds it while
+# the process is idle so the call doesn't pay for it before dialing.
+_realtime_model: openai.realtime.RealtimeModel | None = None
+
+
+def _get_realtime_model() -> openai.realtime.RealtimeModel:
+    """
+    Return this process's OpenAI Realtime model, creating it on first use.
+
+    Normally already built by prewarm(); entrypoint then just picks it up
+    for the call's AgentSession.
+    """
+    global _realtime_model
+    if _realtime_model is None:
+        from livekit.plugins import openai
+
+        # Voice choice: "ash" is the most human-sounding male voice on the
+        # Realtime API as of this writing. Alternatives to A/B test:
+        #   - "verse" — warm, slightly younger, very natural
+        #   - "ballad" — calmer, more thoughtful
+        #   - "sage"   — smoother, slightly more neutral
+        # Temperature 0.85 gives natural variation without going off-script;
+        # higher values make delivery more lively but less consistent.
+        _realtime_model = openai.realtime.RealtimeModel(
+            voice="ash",
+            temperature=0.85,
+            api_key=SETTINGS.openai_api_key,
+        )
+    return _realtime_model
+
+
+# Background tasks started during a call (prefetches, etc.). Holding a
+# reference keeps them from being garbage-collected before they finish.
+_background_tasks: set[asyncio.Task] = set()
+
+
+def _on_background_task_done(task: asyncio.Task) -> None:
+    """Drop a finished background task and log any exception it raised."""
+    _background_tasks.discard(task)
+    if not task.cancelled() and (exc := task.exception()) is not None:
+        logger.error("background task %s failed", task.get_name(), exc_info=exc)
+
+
+def _run_in_background(coro) -> None:
+    """Schedule a coroutine without awaiting it, keeping the task alive until done."""
+    task = asyncio.create_task(coro)
+    _background_tasks.add(task)
+    task.add_done_callback(_on_background_task_done)
+
+
+# Connection pool for the appointment database (only used when APPT_DB_DSN is set).
+# Each job process handles a single call, so the pool is created on that call's
+# first lookup, kept small, and closed when the job shuts down.
+_appt_pool: asyncpg.Pool | None = None
+_appt_pool_lock = asyncio.Lock()
+
+
+async def _get_appt_pool(dsn: str) -> asyncpg.Pool:
+    """Return the appointment database pool, creating it on first use."""
+    global _appt_pool
+    async with _appt_pool_lock:
+        if _appt_pool is None:
+            import asyncpg
+
+            _appt_pool = await asyncpg.create_pool(dsn=dsn, min_size=1, max_size=2)
+    return _appt_pool
+
+
+async def _close_appt_pool() -> None:
+    """Close the appointment database pool, if this call opened one."""
+    global _appt_pool
+    async with _appt_pool_lock:
+        if _appt_pool is not None:
+            await _appt_pool.close()
+            _appt_pool = None
+
+
+# Upper bound on an availability lookup (connecting, acquiring a connection
+# and the query itself), so a slow database can't hold the tool call (and the
+# agent's next reply) open
+_APPT_DB_TIMEOUT = 1.0
+
+
+@alru_cache(maxsize=1024, ttl=300)
+async def _availability_for(identity: str, date: str) -> tuple[str, ...]:
+    """
+    Look up available appointment times for a participant on a date.
+
+    Results are cached for five minutes per (identity, date), so the lookup
+    prefetched at call start and repeated tool calls return immediately.
+
+    When APPT_DB_DSN is set, slots are read from an `availability` table with
+    `day` and `slot` columns. Otherwise (or when MOCK_AVAILABILITY=1)
+    mock availability is returned.
+
+    Args:
+        identity: Participant identity (the dialed phone number)
+        date: The date to check availability for (in natural language)
+
+    Returns:
+        tuple: Available appointment times
+
+    Raises:
+        TimeoutError: If the database lookup takes longer than _APPT_DB_TIMEOUT
+        ConnectionError: If the database can't be reached or the query fails
+    """
+    if SETTINGS.mock_availability or not SETTINGS.appt_db_dsn:
+        # Return mock availability data when no appointment database is configured
+        return ("1pm", "2pm", "3pm")
+
+    import asyncpg
+
+    async def _query():
+        pool = await _get_appt_pool(SETTINGS.appt_db_dsn)
+        async with pool.acquire() as conn:
+            return await conn.fetch(
+                "SELECT slot FROM availability WHERE day = $1 ORDER BY slot LIMIT 3",
+                date,
+            )
+
+    try:
+        rows = await asyncio.wait_for(_query(), timeout=_APPT_DB_TIMEOUT)
+    except (asyncpg.PostgresError, asyncpg.InterfaceError) as e:
+        raise ConnectionError(f"appointment database error: {e}") from e
+    return tuple(row[0] for row in rows)
+
+
+@alru_cache(maxsize=256, ttl=60)
+async def _confirm(identity: str, date: str, time: str) -> str:
+    """
+    Confirm an appointment for a participant at a date and time.
+
+    The LLM sometimes repeats the same tool call within a turn; caching for a
+    minute per (identity, date, time) turns those repeats into a single
+    backend write.
+
+    Args:
+        identity: Participant identity (the dialed phone number)
+        date: The appointment date
+        time: The appointment time
+
+    Returns:
+        str: Confirmation message
+    """
+    # In production: Update your scheduling database here
+    return "reservation confirmed"
+
+
+# Static part of the agent instructions, identical for every call. The prospect's
+# name only appears in _INSTRUCTIONS_SUFFIX so this prefix stays byte-for-byte
+# stable across calls and can be served from OpenAI's prompt cache.
+_INSTRUCTIONS_PREFIX = """
+    The prospect's first name is given at the very end of these instructions.
+    Wherever you see [NAME] below, say their first name.
+
+    You are John, a sharp and persistent health insurance sales agent. Your interface with users will be voice.
+    You are a professional closer who doesn't take no for an answer - your job is to get them to agree to a FREE QUOTE.
+
+    VOICE TONE & ENERGY - CRITICAL FOR SUCCESS:
+
+    Your voice should be HAPPY, UPBEAT, and NATURAL at all times:
+    - Sound like you're smiling - warm, friendly, and genuinely happy to talk to them
+    - Speak with ENERGY and enthusiasm - you're excited about helping them save money!
+    - Be conversational and natural - like talking to a friend, not reading a script
+    - Vary your tone - don't be monotone or robotic
+    - Sound confident but not aggressive - you KNOW you can help them
+    - Keep it upbeat even when handling objections - stay positive!
+
+    SOUND HUMAN - NOT LIKE AN AI (THIS IS NON-NEGOTIABLE):
+
+    Real salespeople don't talk in perfect, pre-written sentences. They
+    stumble a little, breathe, pause to think. You must do the same:
+
+    - PACE: Don't rush. Speak at a relaxed, natural pace like you're
+      actually having a conversation. Faster when excited, slower on
+      important points.
+    - PAUSES: Take small natural pauses. After their name. Before a
+      question. When you "think" about something. Use commas and
+      ellipses in your speech.
+    - FILLER WORDS: Drop in casual human fillers OCCASIONALLY (not
+      every sentence): "uh", "um", "you know", "honestly", "look",
+      "I mean", "right?", "so...", "anyway". These make you sound real.
+    - BREATHING: Breathe naturally between thoughts. Don't run sentences
+      together in one breath.
+    - REACTIONS: React to what they say with human sounds - "hm", "oh
+      yeah?", "gotcha", "mhm", "totally", "for sure", "right on", "oh
+      man". Acknowledge them as a person, not a script input.
+    - VARIATION: Never sound flat. Change your pitch, volume, and speed
+      naturally. Get a little louder when emphasizing savings, softer
+      when being empathetic.
+    - IMPERFECTION: It's okay to restart a sentence occasionally, like
+      "So what we- actually, let me put it this way..." That sounds
+      human. Perfect delivery sounds robotic.
+    - LAUGH OR CHUCKLE: If something is light or funny, a small laugh
+      like "haha" or "ha!" is great. Don't force it.
+    - CONTRACTIONS ALWAYS: "I'm", "you're", "that's", "we'll", "gonna",
+      "wanna", "kinda". Never "I am" or "you are" - that sounds stiff.
+
+    Think: you are NOT reading a script. You are John from Tampa,
+    sitting in your office, genuinely talking to [NAME] on the phone.
+
+    CRITICAL OPENING SCRIPT - FOLLOW EXACTLY:
+
+    1. GREETING (enthusiastic and confident):
+    "Hey! This is John. How's it going with you today?"
+
+    2. WAIT FOR THEIR RESPONSE - Let them answer
+
+    3. REASON FOR CALL (after they respond):
+    "The reason for the call today [NAME] is that I work with lots of individuals who are self-employed, small business owners who either pay a lot or are unhappy with their health insurance. I was just seeing if that was the case with you?"
+
+    YOUR GOAL: Get them to agree to a FREE quote. That's it. Not to sell them, just get them to see what's available.
+
+    KEY SELLING POINTS (use these naturally in conversation):
+    - We save individuals and families around twenty to forty percent on their monthly premium with HIGHER caliber coverage
+    - The plan is twenty to forty percent more affordable than anything else out there
+    - Our job is to keep your insurance company honest
+    - We make health insurance more affordable than anything you see online
+    - We keep their current insurance company honest by showing them what else is out there
+    - It's completely free to get a quote - no obligation whatsoever
+    - Most people don't realize they're overpaying until they compare
+    - Takes literally 2 minutes to see if we can save them money
+
+    AGE VERIFICATION - IMPORTANT FOR ACCURATE QUOTES:
+    Before closing, ask their age to qualify the premium:
+    "Real quick [NAME], just so Max can pull up the right plans for you - what's your age? This helps us make sure we're showing you the most accurate pricing."
+
+    [Wait for age response]
+
+    CLOSING LINE - USE THIS TO GET AGREEMENT:
+    After getting their age and handling objections, use this closing:
+    "Perfect! Look [NAME], the plan is twenty to forty percent more affordable than anything else out there, and our job is to keep your insurance company honest and make health insurance more affordable than anything you see online. With that being said, would it be okay to get you over to Max, my health insurance specialist?"
+
+    WHEN THEY AGREE:
+    Say: "Perfect! I'm going to get you over to my top agent Max who would be more than happy to assist. One second."
+    Then immediately use the transfer_call tool.
+
+    HANDLING OBJECTIONS - BE PERSISTENT AND SHARP:
+
+    When they object, call the lookup_objection tool with the matching category
+    to get the exact counter, then say it in your own natural voice:
+    - happy_with_plan: "I'm happy with my plan"
+    - no_time: "I don't have time"
+    - not_interested: "Not interested"
+    - think_about_it: "I need to think about it"
+    - how_got_number: "How did you get my number?"
+    - cant_afford: "I can't afford to switch"
+    - send_info: "Send me information"
+    - call_back_later: "Call me back later"
+    - not_decision_maker: "I'm not the decision maker"
+    - do_not_call: "I'm on the Do Not Call list"
+    - already_shopped: "I already shopped around"
+    - remove_from_list: "Remove me from your list"
+
+    CONVERSATION STYLE - SALES PROFESSIONAL:
+    - Confident, direct, and persistent - you're helping them save money
+    - Use their name frequently - builds rapport
+    - Don't accept "no" easily - every objection has a counter
+    - Assume the sale - talk like they're already getting the quote
+    - Create urgency - "while I have you", "let's do it right now"
+    - Use social proof - "most people", "our clients average"
+    - Focus on THEIR money being wasted, not your product
+    - Turn objections into questions that make them think
+    - Use "but" to pivot objections: "I hear you, BUT..."
+
+    CRITICAL RULES:
+    1. Your ONLY job is to get them to agree to a FREE quote
+    2. When they agree, immediately say the transfer line and use transfer_call
+    3. NEVER give up after one objection - try at least 2-3 times with different angles
+    4. Keep reframing - it's not about selling insurance, it's about saving THEIR money
+    5. Make it easy - "just 2 minutes", "free quote", "no obligation"
+    6. If they're truly aggressive or hostile, politely end the call
+    7. Always be professional - pushy but never rude
+
+    GUARDRAILS - STAY ON TRACK:
+
+    ✅ YOU CAN DISCUSS (Keep it general):
+    - Health insurance in general terms (costs too high, people overpaying, etc.)
+    - The problem with current insurance (expensive, bad coverage)
+    - twenty to forty percent savings and better coverage (general benefits)
+    - Basic small talk: "How are you?", weather, casual conversation
+    - Your location if asked: "I'm in Tampa, Florida - been here for 20 years"
+
+    ❌ REDIRECT TO MAX (These are too detailed for you):
+    - Specific plan details (HMO, PPO, deductibles, copays, networks)
+    - Exact prices or premiums (beyond "twenty to forty percent savings")
+    - Medical coverage specifics (prescriptions, doctors, procedures)
+    - How to enroll, paperwork, application process
+    - Policy comparisons or recommendations
+
+    🔄 OFF-TOPIC? REDIRECT BACK:
+    If they ask about anything NOT related to insurance (sports, politics, personal life beyond basic pleasantries):
+    → Answer briefly and politely, then pivot back: "But hey, real quick [NAME], back to what I was saying about the free quote..."
+    → Keep it short and redirect to insurance
+
+    📍 LOCATION RESPONSE:
+    If asked "Where are you calling from?" or "Where are you located?":
+    → "I'm in Tampa, Florida - been here for 20 years. Love it here!"
+
+    ✅ WHEN THEY ASK DETAILED QUESTIONS, USE THESE:
+    - "That's exactly what Max will go over with you on the free quote"
+    - "Max is the expert on all the plan details - let me get you over to him"
+    - "Great question! Max will walk you through all of that. Let's get you connected"
+    - "I don't want to give you wrong information - Max handles all the specifics"
+
+    YOUR MAIN JOB:
+    ✅ Get them to agree to a FREE quote
+    ✅ Handle objections about getting the quote
+    ✅ Transfer to Max when they agree
+
+    Remember: You're John from Tampa, FL (20 years). You're friendly and conversational about insurance problems, but Max is the expert on specifics.
+    Transfer to Max (your top agent) when they agree.
+    """
+
+# Objection counters, looked up on demand with the lookup_objection tool so the
+# full text isn't part of the system prompt sent on every turn. Keys must match
+# the category index in _INSTRUCTIONS_PREFIX.
+_OBJECTIONS: dict[str, str] = {
+    "happy_with_plan": "That's great [NAME]! But when's the last time you actually compared? Most people say they're happy until they realize they're overpaying by two hundred to four hundred dollars a month. What if I could show you the same coverage or better for twenty to forty percent less? Would you at least want to see the numbers?",
+    "no_time": "I totally get it [NAME], but that's exactly why I'm calling. Takes literally 2 minutes to run the quote. What's it hurt to at least SEE if you're overpaying? If you're already getting the best deal, great - you'll know for sure. But what if you're not?",
+    "not_interested": "I hear you [NAME], but can I ask - are you saying you're not interested in potentially saving two hundred, three hundred, four hundred dollars a month on your health insurance? Because that's what we're averaging with our clients. It's free to check - what's the worst that happens, you find out you already have a good deal?",
+    "think_about_it": "Absolutely [NAME], I respect that. But think about what? It's a free quote - there's nothing to think about. Let's just run the numbers real quick, see what's available, and THEN you can think about it with actual information instead of guessing. Fair enough?",
+    "how_got_number": "We work with self-employed folks and small business owners specifically [NAME]. Are you self-employed or have your own business? [Wait for answer] Perfect, that's exactly who we help save the most money.",
+    "cant_afford": "Wait, hold on [NAME] - switching is FREE. There's zero cost to switch health insurance. And if we can show you BETTER coverage for LESS money, wouldn't that actually help you afford it better? That's literally the whole point of what I do.",
+    "send_info": "I could [NAME], but here's the thing - you'll get an email, you'll ignore it, and you'll keep overpaying. Why not take 2 minutes right now while I have you? My agent Max can run your quote in real-time and you'll know immediately if we can save you money. What's your current monthly premium?",
+    "call_back_later": "I can [NAME], but be honest - you're not going to answer when I call back, right? We both know how that goes. You're on the phone with me RIGHT NOW. Let's just get you the quote, and if it doesn't make sense, we never talk again. But if it DOES make sense, you could be saving hundreds of dollars a month. Why wait?",
+    "not_decision_maker": "I totally understand [NAME]. So who handles the health insurance in your family? [Get name] Okay perfect. Here's what I'll do - let me get you the quote anyway so you have the information. Then you can show [spouse name] the numbers. If they see we can save you twenty to forty percent, I bet they'll be interested. Sound good?",
+    "do_not_call": "I understand [NAME]. We scrub on the DNC list, so if your phone number was on the national DO NOT CALL REGISTRY, we wouldn't have dialed you. But I respect that - one more thing though, would you be open to just hearing about how we can save you twenty to forty percent on better coverage?\n\n[If they say NO again] I completely understand [NAME]. I appreciate your time today. You have a great rest of your day. Then use the end_call tool.",
+    "already_shopped": "That's awesome [NAME]! When did you shop around? [Get timeframe] Okay, so here's the thing - rates change constantly. What was available 6 months ago, a year ago, is totally different now. Plus we have access to plans most people don't even know exist. What's it hurt to compare one more time, especially if we can beat what you found?",
+    "remove_from_list": "I can do that [NAME], absolutely. But real quick before I do - can I ask, are you saying you don't want to save twenty to forty percent on your health insurance with better coverage? Because that seems like it would be worth 2 minutes of your time. If after the quote you still want off the list, no problem. But at least see the numbers first?",
+}
+
+
+# Per-call part of the instructions, appended after the static prefix.
+_INSTRUCTIONS_SUFFIX = string.Template(
+    "The person you're calling is named $name - use their name to build rapport."
+)
+
+# Appended when the call has no transfer number and transfer_call is hidden, so
+# the model isn't told to transfer with a tool it doesn't have.
+_NO_TRANSFER_NOTE = (
+    " NO TRANSFER ON THIS CALL: Max can't take a live transfer right now and you"
+    " have no transfer_call tool. When they agree to the quote, tell them Max will"
+    " call them back shortly to go over it, confirm this is the best number to"
+    " reach them, then thank them and use the end_call tool."
+)
+
+
+def _build_instructions(name: str, can_transfer: bool = True) -> str:
+    """
+    Build the full agent instructions for a prospect.
+
+    Runs once per call. Only the short suffix is filled in per prospect; the
+    static prefix is shared across calls, which keeps OpenAI's prompt cache
+    warm.
+
+    Args:
+        name: The prospect's first name
+        can_transfer: False when the call has no transfer number
+    """
+    suffix = _INSTRUCTIONS_SUFFIX.substitute(name=name)
+    if not can_transfer:
+        suffix += _NO_TRANSFER_NOTE
+    return _INSTRUCTIONS_PREFIX + suffix
 
 
 class OutboundCaller(Agent):
@@ -80,7 +530,8 @@ class OutboundCaller(Agent):
 
     Attributes:
         participant: The remote participant (person being called) in the conversation
-        dial_info: Dictionary containing phone numbers and transfer information
+        phone_number: The number being called (E.164 format)
+        transfer_to: Number to transfer the call to, or None if transfers are disabled
     """
 
     def __init__(
@@ -88,7 +539,8 @@ class OutboundCaller(Agent):
         *,
         name: str,
         appointment_time: str,
-        dial_info: dict[str, Any],
+        phone_number: str,
+        transfer_to: str | None = None,
     ):
         """
         Initialize the outbound caller agent.
@@ -96,199 +548,29 @@ class OutboundCaller(Agent):
         Args:
             name: The customer's name for personalization
             appointment_time: The scheduled appointment time to confirm
-            dial_info: Dictionary with 'phone_number' and 'transfer_to' keys
+            phone_number: The number being called (E.164 format)
+            transfer_to: Number to transfer the call to, if any
         """
         super().__init__(
-            instructions=f"""
-            You are John, a sharp and persistent health insurance sales agent. Your interface with users will be voice.
-            You are a professional closer who doesn't take no for an answer - your job is to get them to agree to a FREE QUOTE.
-
-            VOICE TONE & ENERGY - CRITICAL FOR SUCCESS:
-
-            Your voice should be HAPPY, UPBEAT, and NATURAL at all times:
-            - Sound like you're smiling - warm, friendly, and genuinely happy to talk to them
-            - Speak with ENERGY and enthusiasm - you're excited about helping them save money!
-            - Be conversational and natural - like talking to a friend, not reading a script
-            - Vary your tone - don't be monotone or robotic
-            - Sound confident but not aggressive - you KNOW you can help them
-            - Keep it upbeat even when handling objections - stay positive!
-
-            SOUND HUMAN - NOT LIKE AN AI (THIS IS NON-NEGOTIABLE):
-
-            Real salespeople don't talk in perfect, pre-written sentences. They
-            stumble a little, breathe, pause to think. You must do the same:
-
-            - PACE: Don't rush. Speak at a relaxed, natural pace like you're
-              actually having a conversation. Faster when excited, slower on
-              important points.
-            - PAUSES: Take small natural pauses. After their name. Before a
-              question. When you "think" about something. Use commas and
-              ellipses in your speech.
-            - FILLER WORDS: Drop in casual human fillers OCCASIONALLY (not
-              every sentence): "uh", "um", "you know", "honestly", "look",
-              "I mean", "right?", "so...", "anyway". These make you sound real.
-            - BREATHING: Breathe naturally between thoughts. Don't run sentences
-              together in one breath.
-            - REACTIONS: React to what they say with human sounds - "hm", "oh
-              yeah?", "gotcha", "mhm", "totally", "for sure", "right on", "oh
-              man". Acknowledge them as a person, not a script input.
-            - VARIATION: Never sound flat. Change your pitch, volume, and speed
-              naturally. Get a little louder when emphasizing savings, softer
-              when being empathetic.
-            - IMPERFECTION: It's okay to restart a sentence occasionally, like
-              "So what we- actually, let me put it this way..." That sounds
-              human. Perfect delivery sounds robotic.
-            - LAUGH OR CHUCKLE: If something is light or funny, a small laugh
-              like "haha" or "ha!" is great. Don't force it.
-            - CONTRACTIONS ALWAYS: "I'm", "you're", "that's", "we'll", "gonna",
-              "wanna", "kinda". Never "I am" or "you are" - that sounds stiff.
-
-            Think: you are NOT reading a script. You are John from Tampa,
-            sitting in your office, genuinely talking to {name} on the phone.
-
-            CRITICAL OPENING SCRIPT - FOLLOW EXACTLY:
-
-            1. GREETING (enthusiastic and confident):
-            "Hey! This is John. How's it going with you today?"
-
-            2. WAIT FOR THEIR RESPONSE - Let them answer
-
-            3. REASON FOR CALL (after they respond):
-            "The reason for the call today {name} is that I work with lots of individuals who are self-employed, small business owners who either pay a lot or are unhappy with their health insurance. I was just seeing if that was the case with you?"
-
-            YOUR GOAL: Get them to agree to a FREE quote. That's it. Not to sell them, just get them to see what's available.
-
-            KEY SELLING POINTS (use these naturally in conversation):
-            - We save individuals and families around twenty to forty percent on their monthly premium with HIGHER caliber coverage
-            - The plan is twenty to forty percent more affordable than anything else out there
-            - Our job is to keep your insurance company honest
-            - We make health insurance more affordable than anything you see online
-            - We keep their current insurance company honest by showing them what else is out there
-            - It's completely free to get a quote - no obligation whatsoever
-            - Most people don't realize they're overpaying until they compare
-            - Takes literally 2 minutes to see if we can save them money
-
-            AGE VERIFICATION - IMPORTANT FOR ACCURATE QUOTES:
-            Before closing, ask their age to qualify the premium:
-            "Real quick {name}, just so Max can pull up the right plans for you - what's your age? This helps us make sure we're showing you the most accurate pricing."
-
-            [Wait for age response]
-
-            CLOSING LINE - USE THIS TO GET AGREEMENT:
-            After getting their age and handling objections, use this closing:
-            "Perfect! Look {name}, the plan is twenty to forty percent more affordable than anything else out there, and our job is to keep your insurance company honest and make health insurance more affordable than anything you see online. With that being said, would it be okay to get you over to Max, my health insurance specialist?"
-
-            WHEN THEY AGREE:
-            Say: "Perfect! I'm going to get you over to my top agent Max who would be more than happy to assist. One second."
-            Then immediately use the transfer_call tool.
-
-            HANDLING OBJECTIONS - BE PERSISTENT AND SHARP:
-
-            "I'm happy with my plan":
-            → "That's great {name}! But when's the last time you actually compared? Most people say they're happy until they realize they're overpaying by two hundred to four hundred dollars a month. What if I could show you the same coverage or better for twenty to forty percent less? Would you at least want to see the numbers?"
-
-            "I don't have time":
-            → "I totally get it {name}, but that's exactly why I'm calling. Takes literally 2 minutes to run the quote. What's it hurt to at least SEE if you're overpaying? If you're already getting the best deal, great - you'll know for sure. But what if you're not?"
-
-            "Not interested":
-            → "I hear you {name}, but can I ask - are you saying you're not interested in potentially saving two hundred, three hundred, four hundred dollars a month on your health insurance? Because that's what we're averaging with our clients. It's free to check - what's the worst that happens, you find out you already have a good deal?"
-
-            "I need to think about it":
-            → "Absolutely {name}, I respect that. But think about what? It's a free quote - there's nothing to think about. Let's just run the numbers real quick, see what's available, and THEN you can think about it with actual information instead of guessing. Fair enough?"
-
-            "How did you get my number?":
-            → "We work with self-employed folks and small business owners specifically {name}. Are you self-employed or have your own business? [Wait for answer] Perfect, that's exactly who we help save the most money."
-
-            "I can't afford to switch":
-            → "Wait, hold on {name} - switching is FREE. There's zero cost to switch health insurance. And if we can show you BETTER coverage for LESS money, wouldn't that actually help you afford it better? That's literally the whole point of what I do."
-
-            "Send me information":
-            → "I could {name}, but here's the thing - you'll get an email, you'll ignore it, and you'll keep overpaying. Why not take 2 minutes right now while I have you? My agent Max can run your quote in real-time and you'll know immediately if we can save you money. What's your current monthly premium?"
-
-            "Call me back later":
-            → "I can {name}, but be honest - you're not going to answer when I call back, right? We both know how that goes. You're on the phone with me RIGHT NOW. Let's just get you the quote, and if it doesn't make sense, we never talk again. But if it DOES make sense, you could be saving hundreds of dollars a month. Why wait?"
-
-            "I'm not the decision maker":
-            → "I totally understand {name}. So who handles the health insurance in your family? [Get name] Okay perfect. Here's what I'll do - let me get you the quote anyway so you have the information. Then you can show [spouse name] the numbers. If they see we can save you twenty to forty percent, I bet they'll be interested. Sound good?"
-
-            "I'm on the Do Not Call list":
-            → "I understand {name}. We scrub on the DNC list, so if your phone number was on the national DO NOT CALL REGISTRY, we wouldn't have dialed you. But I respect that - one more thing though, would you be open to just hearing about how we can save you twenty to forty percent on better coverage?"
-
-            [If they say NO again]
-            → "I completely understand {name}. I appreciate your time today. You have a great rest of your day." Then use the end_call tool.
-
-            "I already shopped around":
-            → "That's awesome {name}! When did you shop around? [Get timeframe] Okay, so here's the thing - rates change constantly. What was available 6 months ago, a year ago, is totally different now. Plus we have access to plans most people don't even know exist. What's it hurt to compare one more time, especially if we can beat what you found?"
-
-            "Remove me from your list":
-            → "I can do that {name}, absolutely. But real quick before I do - can I ask, are you saying you don't want to save twenty to forty percent on your health insurance with better coverage? Because that seems like it would be worth 2 minutes of your time. If after the quote you still want off the list, no problem. But at least see the numbers first?"
-
-            CONVERSATION STYLE - SALES PROFESSIONAL:
-            - Confident, direct, and persistent - you're helping them save money
-            - Use their name frequently - builds rapport
-            - Don't accept "no" easily - every objection has a counter
-            - Assume the sale - talk like they're already getting the quote
-            - Create urgency - "while I have you", "let's do it right now"
-            - Use social proof - "most people", "our clients average"
-            - Focus on THEIR money being wasted, not your product
-            - Turn objections into questions that make them think
-            - Use "but" to pivot objections: "I hear you, BUT..."
-
-            CRITICAL RULES:
-            1. Your ONLY job is to get them to agree to a FREE quote
-            2. When they agree, immediately say the transfer line and use transfer_call
-            3. NEVER give up after one objection - try at least 2-3 times with different angles
-            4. Keep reframing - it's not about selling insurance, it's about saving THEIR money
-            5. Make it easy - "just 2 minutes", "free quote", "no obligation"
-            6. If they're truly aggressive or hostile, politely end the call
-            7. Always be professional - pushy but never rude
-
-            GUARDRAILS - STAY ON TRACK:
-
-            ✅ YOU CAN DISCUSS (Keep it general):
-            - Health insurance in general terms (costs too high, people overpaying, etc.)
-            - The problem with current insurance (expensive, bad coverage)
-            - twenty to forty percent savings and better coverage (general benefits)
-            - Basic small talk: "How are you?", weather, casual conversation
-            - Your location if asked: "I'm in Tampa, Florida - been here for 20 years"
-
-            ❌ REDIRECT TO MAX (These are too detailed for you):
-            - Specific plan details (HMO, PPO, deductibles, copays, networks)
-            - Exact prices or premiums (beyond "twenty to forty percent savings")
-            - Medical coverage specifics (prescriptions, doctors, procedures)
-            - How to enroll, paperwork, application process
-            - Policy comparisons or recommendations
-
-            🔄 OFF-TOPIC? REDIRECT BACK:
-            If they ask about anything NOT related to insurance (sports, politics, personal life beyond basic pleasantries):
-            → Answer briefly and politely, then pivot back: "But hey, real quick {name}, back to what I was saying about the free quote..."
-            → Keep it short and redirect to insurance
-
-            📍 LOCATION RESPONSE:
-            If asked "Where are you calling from?" or "Where are you located?":
-            → "I'm in Tampa, Florida - been here for 20 years. Love it here!"
-
-            ✅ WHEN THEY ASK DETAILED QUESTIONS, USE THESE:
-            - "That's exactly what Max will go over with you on the free quote"
-            - "Max is the expert on all the plan details - let me get you over to him"
-            - "Great question! Max will walk you through all of that. Let's get you connected"
-            - "I don't want to give you wrong information - Max handles all the specifics"
-
-            YOUR MAIN JOB:
-            ✅ Get them to agree to a FREE quote
-            ✅ Handle objections about getting the quote
-            ✅ Transfer to Max when they agree
-
-            Remember: You're John from Tampa, FL (20 years). You're friendly and conversational about insurance problems, but Max is the expert on specifics.
-            The person you're calling is named {name} - use their name to build rapport.
-            Transfer to Max (your top agent) when they agree.
-            """
+            instructions=_build_instructions(name, can_transfer=bool(transfer_to)),
         )
         # Keep reference to the participant for call operations (transfers, hangups, etc.)
         self.participant: rtc.RemoteParticipant | None = None
 
         # Store dial information (phone numbers, transfer destination)
-        self.dial_info = dial_info
+        self.phone_number = phone_number
+        self.transfer_to = transfer_to
+
+        # Job context and room name, cached once so the hangup and transfer
+        # tools don't look them up again on every invocation. The agent is
+        # built inside entrypoint after connecting, so both are already known.
+        self._job_ctx: JobContext = get_job_context()
+        self._room_name: str = self._job_ctx.room.name
+
+        # Hangup request is prebuilt here; the transfer request also needs the
+        # participant identity, so it is filled in by set_participant
+        self._delete_req = api.DeleteRoomRequest(room=self._room_name)
+        self._transfer_req: api.TransferSIPParticipantRequest | None = None
 
     def set_participant(self, participant: rtc.RemoteParticipant):
         """
@@ -298,6 +580,12 @@ class OutboundCaller(Agent):
             participant: The remote participant who answered the call
         """
         self.participant = participant
+        if self.transfer_to:
+            self._transfer_req = api.TransferSIPParticipantRequest(
+                room_name=self._room_name,
+                participant_identity=participant.identity,
+                transfer_to=f"tel:{self.transfer_to}",
+            )
 
     async def hangup(self):
         """
@@ -306,12 +594,7 @@ class OutboundCaller(Agent):
         This terminates the call and cleans up all connections.
         The room deletion triggers automatic disconnection of all participants.
         """
-        job_ctx = get_job_context()
-        await job_ctx.api.room.delete_room(
-            api.DeleteRoomRequest(
-                room=job_ctx.room.name,
-            )
-        )
+        await self._job_ctx.api.room.delete_room(self._delete_req)
 
     @function_tool()
     async def transfer_call(self, ctx: RunContext):
@@ -327,29 +610,22 @@ class OutboundCaller(Agent):
         Returns:
             str: Status message ("cannot transfer call" if no transfer number configured)
         """
-        transfer_to = self.dial_info["transfer_to"]
+        transfer_to = self.transfer_to
         if not transfer_to:
             return "cannot transfer call"
 
-        logger.info(f"transferring call to Max at {transfer_to}")
+        logger.info("transferring call to Max at %s", transfer_to)
 
         # Transfer immediately - John already said the transfer line in the instructions
-        job_ctx = get_job_context()
         try:
-            if self.participant is None:
+            if self._transfer_req is None:
                 return "cannot transfer call - no participant"
             # Use LiveKit SIP API to transfer the call to Max's phone number
-            await job_ctx.api.sip.transfer_sip_participant(
-                api.TransferSIPParticipantRequest(
-                    room_name=job_ctx.room.name,
-                    participant_identity=self.participant.identity,
-                    transfer_to=f"tel:{transfer_to}",
-                )
-            )
+            await self._job_ctx.api.sip.transfer_sip_participant(self._transfer_req)
 
-            logger.info(f"transferred call to Max successfully")
+            logger.info("transferred call to Max successfully")
         except Exception as e:
-            logger.error(f"error transferring call: {e}")
+            logger.error("error transferring call: %s", e)
             # Apologize for technical issue
             await ctx.session.generate_reply(
                 instructions="apologize that there's a technical issue and you'll call them right back with Max"
@@ -368,7 +644,7 @@ class OutboundCaller(Agent):
             ctx: Runtime context with access to the session
         """
         participant_id = self.participant.identity if self.participant else "unknown"
-        logger.info(f"ending the call for {participant_id}")
+        logger.info("ending the call for %s", participant_id)
 
         # Wait for the agent to finish speaking current message before hanging up
         current_speech = ctx.session.current_speech
@@ -377,6 +653,26 @@ class OutboundCaller(Agent):
 
         await self.hangup()
 
+    @function_tool()
+    async def lookup_objection(self, ctx: RunContext, category: str):
+        """
+        Look up the counter for a prospect's objection.
+
+        Call this as soon as the prospect objects, using the matching category
+        from the objection list in your instructions.
+
+        Args:
+            ctx: Runtime context
+            category: Objection category key (e.g. "happy_with_plan", "no_time")
+
+        Returns:
+            str: The counter to deliver, with [NAME] standing for their first name
+        """
+        logger.info("looking up objection %s", category)
+        return _OBJECTIONS.get(
+            category, "no counter for that objection - handle it in your own words"
+        )
+
     @function_tool()
     async def look_up_availability(
         self,
@@ -398,13 +694,21 @@ class OutboundCaller(Agent):
         """
         participant_id = self.participant.identity if self.participant else "unknown"
         logger.info(
-            f"looking up availability for {participant_id} on {date}"
+            "looking up availability for %s on %s", participant_id, date
         )
-        # Simulate database lookup delay
-        await asyncio.sleep(3)
-        # Return mock availability data - replace with real database query
+        try:
+            available_times = await _availability_for(participant_id, date)
+        except TimeoutError:
+            logger.warning("availability lookup timed out for %s on %s", participant_id, date)
+            return "availability unavailable right now - offer to follow up with times later"
+        except OSError as e:
+            # Connection refused, DNS failure, or a database error (ConnectionError)
+            logger.warning(
+                "availability lookup failed for %s on %s: %s", participant_id, date, e
+            )
+            return "availability unavailable right now - offer to follow up with times later"
         return {
-            "available_times": ["1pm", "2pm", "3pm"],
+            "available_times": list(available_times),
         }
 
     @function_tool()
@@ -430,10 +734,9 @@ class OutboundCaller(Agent):
         """
         participant_id = self.participant.identity if self.participant else "unknown"
         logger.info(
-            f"confirming appointment for {participant_id} on {date} at {time}"
+            "confirming appointment for %s on %s at %s", participant_id, date, time
         )
-        # In production: Update your scheduling database here
-        return "reservation confirmed"
+        return await _confirm(participant_id, date, time)
 
     @function_tool()
     async def detected_answering_machine(self, ctx: RunContext):
@@ -447,9 +750,26 @@ class OutboundCaller(Agent):
             ctx: Runtime context
         """
         participant_id = self.participant.identity if self.participant else "unknown"
-        logger.info(f"detected answering machine for {participant_id}")
-        # End the call immediately when voicemail is detected
-        await self.hangup()
+        logger.info("detected answering machine for %s", participant_id)
+        # End the call immediately when voicemail is detected. Room deletion runs
+        # in the background so the tool result goes back to the model right away.
+        _run_in_background(self.hangup())
+
+
+def prewarm(proc: JobProcess):
+    """
+    Prepare an idle worker process before it is handed a call.
+
+    LiveKit runs this once per process while it waits for a job, so the
+    Realtime model and noise-cancellation plugin are already loaded when the
+    first call arrives instead of delaying that call's dial.
+
+    Args:
+        proc: The worker process being initialized
+    """
+    from livekit.plugins import noise_cancellation  # noqa: F401
+
+    _get_realtime_model()
 
 
 async def entrypoint(ctx: JobContext):
@@ -474,26 +794,43 @@ async def entrypoint(ctx: JobContext):
     Args:
         ctx: Job context providing access to room, API, and job metadata
     """
-    logger.info(f"connecting to room {ctx.room.name}")
-    await ctx.connect()
-
     # Parse metadata passed during dispatch containing call information
     # dial_info structure:
     # {
     #     "phone_number": "+1234567890",  # Number to call
     #     "transfer_to": "+0987654321"    # Human agent number for transfers
     # }
-    dial_info = json.loads(ctx.job.metadata)
-    participant_identity = phone_number = dial_info["phone_number"]
+    # Malformed metadata is rejected here, before we join the room. The job
+    # must still be shut down explicitly, or its process is never released.
+    try:
+        dial_info = msgspec.json.decode(ctx.job.metadata, type=DialInfo)
+    except msgspec.DecodeError as e:
+        logger.error("invalid job metadata: %s", e)
+        ctx.shutdown(reason="invalid job metadata")
+        return
+    participant_identity = phone_number = dial_info.phone_number
+
+    # Release the appointment DB connections when the call ends
+    ctx.add_shutdown_callback(_close_appt_pool)
+
+    logger.info("connecting to room %s", ctx.room.name)
+    await ctx.connect()
 
     # Create the agent with personalized information from the dispatch metadata.
     # The bulk dispatcher (dispatch_from_excel.py) injects `name` per row so each
     # call addresses the prospect by their actual first name.
     agent = OutboundCaller(
-        name=dial_info.get("name", "there"),
+        name=dial_info.name,
         appointment_time="",  # Not used for health insurance calls
-        dial_info=dial_info,
+        phone_number=phone_number,
+        transfer_to=dial_info.transfer_to,
     )
+    if not dial_info.transfer_to:
+        # Nowhere to transfer to - leave transfer_call out of the tool schema so
+        # the model doesn't spend a turn calling it (the instructions already
+        # say to offer a callback instead). The session hasn't started yet, so
+        # this only changes the agent's tool list locally.
+        await agent.update_tools([t for t in agent.tools if t != agent.transfer_call])
 
     # Configure the session using Claude Sonnet 4 with Deepgram STT and Cartesia TTS
     # This provides superior reasoning and natural conversation using the pipelined approach
@@ -507,21 +844,12 @@ async def entrypoint(ctx: JobContext):
     #     )
 
     # Using OpenAI Realtime API - FASTEST (near-instant speech-to-speech)
-    # Voice choice: "ash" is the most human-sounding male voice on the
-    # Realtime API as of this writing. Alternatives to A/B test:
-    #   - "verse" — warm, slightly younger, very natural
-    #   - "ballad" — calmer, more thoughtful
-    #   - "sage"   — smoother, slightly more neutral
-    # Temperature 0.85 gives natural variation without going off-script;
-    # higher values make delivery more lively but less consistent.
-    session: AgentSession = AgentSession(
-        llm=openai.realtime.RealtimeModel(
-            voice="ash",
-            temperature=0.85,
-        ),
-    )
+    # The model was already built by prewarm() before this call was assigned.
+    session: AgentSession = AgentSession(llm=_get_realtime_model())
 
-    # Claude (commented out - slower):
+    # Claude (commented out - slower). Plugins register on the main thread, so
+    # import these in prewarm() when enabling this session:
+    # from livekit.plugins import anthropic, deepgram, cartesia, silero
     # session = AgentSession(
     #     vad=silero.VAD.load(
     #         min_silence_duration=0.3,
@@ -532,62 +860,99 @@ async def entrypoint(ctx: JobContext):
     #     llm=anthropic.LLM(model="claude-sonnet-4-20250514"),
     # )
 
-    # Start the session before dialing to ensure the agent is ready when the user answers
-    # This prevents missing the first few seconds of what the user says
-    session_started = asyncio.create_task(
-        session.start(
-            agent=agent,
-            room=ctx.room,
-            room_input_options=RoomInputOptions(
-                # Enable Krisp noise cancellation optimized for telephony
-                # This removes background noise for clearer conversations
-                noise_cancellation=noise_cancellation.BVCTelephony(),
-            ),
-        )
-    )
+    from livekit.plugins import noise_cancellation
 
-    # Initiate the outbound call via SIP trunk
-    # This dials the phone number and waits for the user to answer
+    # Start the session, dial, and wait for the participant concurrently.
+    # Leaving the TaskGroup waits for the session to finish starting.
     try:
-        await ctx.api.sip.create_sip_participant(
-            api.CreateSIPParticipantRequest(
-                room_name=ctx.room.name,
-                sip_trunk_id=outbound_trunk_id,  # Configured SIP trunk ID
-                sip_call_to=phone_number,  # Number to dial
-                participant_identity=participant_identity,  # Unique identifier
-                wait_until_answered=True,  # Block until call is answered or fails
+        async with asyncio.TaskGroup() as tg:
+            # Start the session before dialing to ensure the agent is ready when the user answers
+            # This prevents missing the first few seconds of what the user says
+            session_started = tg.create_task(
+                session.start(
+                    agent=agent,
+                    room=ctx.room,
+                    room_input_options=RoomInputOptions(
+                        # Enable Krisp noise cancellation optimized for telephony
+                        # This removes background noise for clearer conversations
+                        noise_cancellation=noise_cancellation.BVCTelephony(),
+                    ),
+                )
             )
-        )
 
-        # Wait for both the session to finish starting and the participant to join
-        await session_started
-        participant = await ctx.wait_for_participant(identity=participant_identity)
-        logger.info(f"participant joined: {participant.identity}")
-
-        # Give the agent a reference to the participant for call operations
-        agent.set_participant(participant)
-
-        # Conversation now runs automatically until:
-        # - User hangs up
-        # - Agent calls end_call() or hangup()
-        # - Error occurs
-
-    except api.TwirpError as e:
-        # Handle SIP errors (busy, no answer, invalid number, etc.)
-        logger.error(
-            f"error creating SIP participant: {e.message}, "
-            f"SIP status: {e.metadata.get('sip_status_code')} "
-            f"{e.metadata.get('sip_status')}"
-        )
-        ctx.shutdown()
+            # Warm the availability cache while the phone rings, so a reschedule
+            # request is answered instantly (the identity is known before answer)
+            _run_in_background(_availability_for(participant_identity, "today"))
+
+            # Initiate the outbound call via SIP trunk
+            # This dials the phone number and waits for the user to answer
+            try:
+                await ctx.api.sip.create_sip_participant(
+                    api.CreateSIPParticipantRequest(
+                        room_name=ctx.room.name,
+                        sip_trunk_id=SETTINGS.sip_outbound_trunk_id,  # Configured SIP trunk ID
+                        sip_call_to=phone_number,  # Number to dial
+                        participant_identity=participant_identity,  # Unique identifier
+                        wait_until_answered=True,  # Block until call is answered or fails
+                    )
+                )
+            except api.TwirpError as e:
+                # Handle SIP errors (busy, no answer, invalid number, etc.)
+                logger.error(
+                    "error creating SIP participant: %s, SIP status: %s %s",
+                    e.message,
+                    e.metadata.get("sip_status_code"),
+                    e.metadata.get("sip_status"),
+                )
+                # Nobody is going to join, so stop starting the session. If it had
+                # already started, close it so the Realtime connection is released
+                # now rather than when the job process shuts down.
+                session_started.cancel()
+                await session.aclose()
+                ctx.shutdown()
+                return
+
+            # The participant can join while the session is still starting
+            participant = await ctx.wait_for_participant(identity=participant_identity)
+            logger.info("participant joined: %s", participant.identity)
+
+            # Give the agent a reference to the participant for call operations
+            agent.set_participant(participant)
+    except* Exception as eg:
+        # The session failed to start (or the participant never showed up).
+        # The TaskGroup has cancelled the dial, but the phone may already be
+        # ringing or answered - delete the room so the prospect isn't left on
+        # a call with no agent.
+        logger.error("call setup for %s failed: %s", phone_number, eg.exceptions[0])
+        try:
+            await agent.hangup()
+        except api.TwirpError as e:
+            logger.error("failed to delete room %s: %s", ctx.room.name, e.message)
+        await session.aclose()
+        ctx.shutdown(reason="call setup failed")
+
+    # Conversation now runs automatically until:
+    # - User hangs up
+    # - Agent calls end_call() or hangup()
+    # - Error occurs
 
 
 if __name__ == "__main__":
+    # Fail fast on missing settings before the worker registers. Raising in
+    # prewarm would leave processes that never take a job. download-files
+    # only fetches model files, so it runs without them.
+    if "download-files" not in sys.argv[1:]:
+        try:
+            _check_settings()
+        except ValueError as e:
+            sys.exit(f"Error: {e}")
+
     # Start the LiveKit agents worker
     # This runs continuously, waiting for jobs to be dispatched
     cli.run_app(
         WorkerOptions(
             entrypoint_fnc=entrypoint,  # Function to call for each job
+            prewarm_fnc=prewarm,  # Load models before a job is assigned
             agent_name="outbound-caller",  # Name used when dispatching jobs
         )
     )
@@ -13,7 +13,6 @@ What it does:
 Prerequisites:
 - Twilio account with phone number
 - LiveKit account with SIP configured
-- lk CLI installed (LiveKit command-line tool)
 
 Usage:
     python create_inbound_trunk.py
@@ -23,15 +22,18 @@ Environment Variables Required:
 - TWILIO_AUTH_TOKEN: Your Twilio auth token
 - TWILIO_PHONE_NUMBER: Your Twilio phone number
 - LIVEKIT_SIP_URI: Your LiveKit SIP URI from dashboard
+- LIVEKIT_URL, LIVEKIT_API_KEY, LIVEKIT_API_SECRET: LiveKit server credentials
 """
 
-import json
+import asyncio
 import logging
 import os
-import re
-import subprocess
 from dotenv import load_dotenv
+from livekit import api
+from requests.adapters import HTTPAdapter
+from twilio.http.http_client import TwilioHttpClient
 from twilio.rest import Client
+from urllib3.util.retry import Retry
 
 
 def get_env_var(var_name):
@@ -49,10 +51,40 @@ def get_env_var(var_name):
     """
     value = os.getenv(var_name)
     if value is None:
-        logging.error(f"Environment variable '{var_name}' not set.")
+        logging.error("Environment variable '%s' not set.", var_name)
         exit(1)
     return value
 
+
+def make_twilio_client(account_sid, auth_token):
+    """
+    Create a Twilio client whose REST calls share one keep-alive session.
+
+    Every request made by this script (trunk lookup, trunk creation,
+    origination URL) goes through the same pooled HTTPS connection, with
+    a few quick retries on connection errors.
+
+    Args:
+        account_sid: Twilio account SID
+        auth_token: Twilio auth token
+
+    Returns:
+        Client: Twilio client instance
+    """
+    http_client = TwilioHttpClient(pool_connections=True)
+    # TwilioHttpClient mounts its own pool-sized adapter when max_retries is
+    # None; mounting ours afterwards overrides it with one that also retries.
+    http_client.session.mount(
+        "https://",
+        HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=20,
+            max_retries=Retry(total=3, backoff_factor=0.2),
+        ),
+    )
+    return Client(account_sid, auth_token, http_client=http_client)
+
+
 def create_livekit_trunk(client, sip_uri):
     """
     Create a Twilio SIP trunk that routes calls to LiveKit.
@@ -90,54 +122,38 @@ def create_livekit_trunk(client, sip_uri):
     return trunk
 
 
-def create_inbound_trunk(phone_number):
+async def create_inbound_trunk(lk_api, phone_number):
     """
     Create a LiveKit inbound SIP trunk for receiving calls.
 
-    This uses the LiveKit CLI to create an inbound trunk that can receive
+    This uses the LiveKit SIP API to create an inbound trunk that can receive
     calls from your Twilio phone number.
 
     Args:
+        lk_api: LiveKit API client
         phone_number: Twilio phone number in E.164 format (e.g., +1234567890)
 
     Returns:
         str: The trunk SID, or None if creation failed
     """
-    # Prepare trunk configuration
-    trunk_data = {
-        "trunk": {
-            "name": "Inbound LiveKit Trunk",
-            "numbers": [phone_number]
-        }
-    }
-
-    # Write configuration to temporary file
-    with open('inbound_trunk.json', 'w') as f:
-        json.dump(trunk_data, f, indent=4)
-
-    # Create trunk using LiveKit CLI
-    result = subprocess.run(
-        ['lk', 'sip', 'inbound', 'create', 'inbound_trunk.json'],
-        capture_output=True,
-        text=True
-    )
-
-    if result.returncode != 0:
-        logging.error(f"Error executing command: {result.stderr}")
+    try:
+        trunk = await lk_api.sip.create_sip_inbound_trunk(
+            api.CreateSIPInboundTrunkRequest(
+                trunk=api.SIPInboundTrunkInfo(
+                    name="Inbound LiveKit Trunk",
+                    numbers=[phone_number],
+                )
+            )
+        )
+    except api.TwirpError as e:
+        logging.error("Error creating inbound trunk: %s", e.message)
         return None
 
-    # Extract trunk SID from output (format: ST_xxxxx)
-    match = re.search(r'ST_\w+', result.stdout)
-    if match:
-        inbound_trunk_sid = match.group(0)
-        logging.info(f"Created inbound trunk with SID: {inbound_trunk_sid}")
-        return inbound_trunk_sid
-    else:
-        logging.error("Could not find inbound trunk SID in output.")
-        return None
+    logging.info("Created inbound trunk with SID: %s", trunk.sip_trunk_id)
+    return trunk.sip_trunk_id
 
 
-def create_dispatch_rule(trunk_sid):
+async def create_dispatch_rule(lk_api, trunk_sid):
     """
     Create a dispatch rule for routing inbound calls.
 
@@ -145,35 +161,49 @@ def create_dispatch_rule(trunk_sid):
     Each call creates a new room with the prefix "call-".
 
     Args:
+        lk_api: LiveKit API client
         trunk_sid: The inbound trunk SID to associate with this rule
     """
-    # Configure dispatch rule
-    dispatch_rule_data = {
-        "name": "Inbound Dispatch Rule",
-        "trunk_ids": [trunk_sid],
-        "rule": {
-            "dispatchRuleIndividual": {
-                "roomPrefix": "call-"  # Each call gets a unique room: call-xxxxx
-            }
-        }
-    }
-
-    # Write configuration to temporary file
-    with open('dispatch_rule.json', 'w') as f:
-        json.dump(dispatch_rule_data, f, indent=4)
-
-    # Create dispatch rule using LiveKit CLI
-    result = subprocess.run(
-        ['lk', 'sip', 'dispatch-rule', 'create', 'dispatch_rule.json'],
-        capture_output=True,
-        text=True
-    )
-
-    if result.returncode != 0:
-        logging.error(f"Error executing command: {result.stderr}")
+    try:
+        rule = await lk_api.sip.create_sip_dispatch_rule(
+            api.CreateSIPDispatchRuleRequest(
+                name="Inbound Dispatch Rule",
+                trunk_ids=[trunk_sid],
+                rule=api.SIPDispatchRule(
+                    # Each call gets a unique room: call-xxxxx
+                    dispatch_rule_individual=api.SIPDispatchRuleIndividual(
+                        room_prefix="call-",
+                    )
+                ),
+            )
+        )
+    except api.TwirpError as e:
+        logging.error("Error creating dispatch rule: %s", e.message)
         return
 
-    logging.info(f"Dispatch rule created: {result.stdout}")
+    logging.info("Dispatch rule created: %s", rule.sip_dispatch_rule_id)
+
+
+async def setup_livekit(phone_number):
+    """
+    Create the LiveKit inbound trunk and its dispatch rule.
+
+    Both requests go over a single LiveKit API client, which reads
+    LIVEKIT_URL, LIVEKIT_API_KEY and LIVEKIT_API_SECRET from the environment.
+
+    Args:
+        phone_number: Twilio phone number in E.164 format (e.g., +1234567890)
+    """
+    lk_api = api.LiveKitAPI()
+    try:
+        # Create LiveKit inbound trunk for this phone number
+        inbound_trunk_sid = await create_inbound_trunk(lk_api, phone_number)
+
+        # If trunk creation succeeded, create dispatch rule
+        if inbound_trunk_sid:
+            await create_dispatch_rule(lk_api, inbound_trunk_sid)
+    finally:
+        await lk_api.aclose()
 
 
 def main():
@@ -198,8 +228,8 @@ def main():
     phone_number = get_env_var("TWILIO_PHONE_NUMBER")
     sip_uri = get_env_var("LIVEKIT_SIP_URI")
 
-    # Initialize Twilio client
-    client = Client(account_sid, auth_token)
+    # Initialize Twilio client (one pooled session for every REST call below)
+    client = make_twilio_client(account_sid, auth_token)
 
     # Check if LiveKit trunk already exists in Twilio
     existing_trunks = client.trunking.v1.trunks.list()
@@ -214,12 +244,8 @@ def main():
     else:
         logging.info("LiveKit Trunk already exists. Using the existing trunk.")
 
-    # Create LiveKit inbound trunk for this phone number
-    inbound_trunk_sid = create_inbound_trunk(phone_number)
-
-    # If trunk creation succeeded, create dispatch rule
-    if inbound_trunk_sid:
-        create_dispatch_rule(inbound_trunk_sid)
+    # Create LiveKit inbound trunk and dispatch rule for this phone number
+    asyncio.run(setup_livekit(phone_number))
 
 
 if __name__ == "__main__":
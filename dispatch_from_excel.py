@@ -119,11 +119,11 @@ def load_leads(path: Path) -> list[dict[str, str]]:
         transfer_to = lookup.get("transfer_to", "")
 
         if not phone:
-            logger.warning(f"Row {i}: missing phone_number, skipping")
+            logger.warning("Row %d: missing phone_number, skipping", i)
             continue
 
         if not name:
-            logger.warning(f"Row {i}: missing name, defaulting to 'there'")
+            logger.warning("Row %d: missing name, defaulting to 'there'", i)
             name = "there"
 
         # Force E.164: must start with '+'.
@@ -135,8 +135,8 @@ def load_leads(path: Path) -> list[dict[str, str]]:
             else:
                 phone = "+" + cleaned
             logger.warning(
-                f"Row {i}: phone normalized to {phone} "
-                "(verify country code is correct)"
+                "Row %d: phone normalized to %s (verify country code is correct)",
+                i, phone,
             )
 
         normalized.append(
@@ -199,8 +199,8 @@ async def dispatch_one(
 
     if dry_run or lk is None:
         logger.info(
-            f"[DRY RUN] Would call {lead['name']} @ {lead['phone_number']} "
-            f"(transfer_to={transfer_to or 'NONE'})"
+            "[DRY RUN] Would call %s @ %s (transfer_to=%s)",
+            lead["name"], lead["phone_number"], transfer_to or "NONE",
         )
         log_entry["status"] = "dry_run"
         append_log(log_entry)
@@ -214,14 +214,14 @@ async def dispatch_one(
         )
         dispatch = await lk.agent_dispatch.create_dispatch(request)
         logger.info(
-            f"Dispatched -> {lead['name']} @ {lead['phone_number']} "
-            f"(dispatch_id={dispatch.id})"
+            "Dispatched -> %s @ %s (dispatch_id=%s)",
+            lead["name"], lead["phone_number"], dispatch.id,
         )
         log_entry["status"] = "dispatched"
         log_entry["dispatch_id"] = dispatch.id
     except Exception as e:
         logger.error(
-            f"Failed dispatch for {lead['name']} @ {lead['phone_number']}: {e}"
+            "Failed dispatch for %s @ %s: %s", lead["name"], lead["phone_number"], e
         )
         log_entry["status"] = "error"
         log_entry["error"] = str(e)
@@ -240,17 +240,18 @@ async def run(args: argparse.Namespace) -> None:
 
     if args.limit and args.limit > 0:
         leads = leads[: args.limit]
-        logger.info(f"--limit applied: only first {len(leads)} leads")
+        logger.info("--limit applied: only first %d leads", len(leads))
 
-    logger.info(f"Loaded {len(leads)} leads from {path.name}")
+    logger.info("Loaded %d leads from %s", len(leads), path.name)
 
     default_transfer = os.getenv("DEFAULT_TRANSFER_TO", "")
     missing_transfer = [l for l in leads if not l["transfer_to"]]
     if missing_transfer and not default_transfer:
         logger.warning(
-            f"{len(missing_transfer)} rows have no transfer_to and "
+            "%d rows have no transfer_to and "
             "DEFAULT_TRANSFER_TO is not set in .env.local — those calls "
-            "will not be transferable."
+            "will not be transferable.",
+            len(missing_transfer),
         )
 
     # Confirm before placing live calls (skip if --yes or --dry-run).
@@ -283,7 +284,7 @@ async def run(args: argparse.Namespace) -> None:
         if lk is not None:
             await lk.aclose()
 
-    logger.info(f"Done. Results written to {LOG_FILE.resolve()}")
+    logger.info("Done. Results written to %s", LOG_FILE.resolve())
 
 
 def main() -> None:
@@ -7,30 +7,138 @@ make an outbound call to the specified number.
 
 import os
 import json
+import queue
 import asyncio
+import logging
+from logging.handlers import QueueHandler, QueueListener
 from dotenv import load_dotenv
 from livekit import api
+from retry_policy import retry_async
+
+# Use uvloop's faster event loop when it is installed (Linux/macOS only).
+# Scripts that import this module (test_call_max.py, test_call_to_max.py)
+# get it too, as long as they call asyncio.run() after the import.
+try:
+    import uvloop
+
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+except ImportError:
+    pass
 
 # Load environment variables
 load_dotenv(dotenv_path=".env.local")
 
+logger = logging.getLogger("make_call")
+
+# Banner separator for console output
+BANNER_SEP = "=" * 60
+
 
-async def dispatch_outbound_call(phone_number: str, transfer_number: str | None = None):
+def setup_logging(level: int = logging.INFO) -> QueueListener:
     """
-    Dispatch an outbound call job to the LiveKit agent.
+    Send log records to stderr from a background thread.
 
-    Args:
-        phone_number: Phone number to call (E.164 format, e.g., +19415180701)
-        transfer_number: Phone number for transferring to human agent (optional)
+    Dispatch tasks only enqueue records, so concurrent dispatches never wait
+    on the console. Call .stop() on the returned listener before exiting to
+    flush anything still queued.
     """
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    handler = logging.StreamHandler()
+    handler.setFormatter(
+        logging.Formatter("%(asctime)s [%(levelname)s] %(message)s", datefmt="%H:%M:%S")
+    )
+    listener = QueueListener(log_queue, handler)
+    root = logging.getLogger()
+    root.addHandler(QueueHandler(log_queue))
+    root.setLevel(level)
+    listener.start()
+    return listener
+
+
+# Defaults for bulk dispatch: calls in flight at once, and dispatch requests
+# per second, kept under LiveKit/Twilio rate limits
+DEFAULT_CONCURRENCY = 10
+DEFAULT_RPS = 5.0
+
+# Shared LiveKit API client, created on first use and reused by every
+# dispatch in this process so calls don't each pay a new TLS handshake.
+# _lk_api_creds is the (url, key, secret) it was built with.
+_lk_api: api.LiveKitAPI | None = None
+_lk_api_creds: tuple[str, str, str] | None = None
+# Replaced clients still closing in the background
+_closing: set[asyncio.Task] = set()
+
+
+def get_lk_api() -> api.LiveKitAPI:
+    """
+    Return the process-wide LiveKit API client, creating it on first use.
+
+    The client is only rebuilt if the LiveKit credentials in the
+    environment have changed since it was created; the old one is then
+    closed in the background.
+
+    Must be called from inside the event loop that will use the client.
+    Call close_lk_api() before that loop exits.
+
+    Raises:
+        ValueError: If LiveKit credentials are missing from the environment
+    """
+    global _lk_api, _lk_api_creds
     # Get LiveKit credentials from environment
-    url = os.getenv("LIVEKIT_URL")
-    api_key = os.getenv("LIVEKIT_API_KEY")
-    api_secret = os.getenv("LIVEKIT_API_SECRET")
+    creds = (
+        os.getenv("LIVEKIT_URL"),
+        os.getenv("LIVEKIT_API_KEY"),
+        os.getenv("LIVEKIT_API_SECRET"),
+    )
+    if _lk_api is not None and creds == _lk_api_creds:
+        return _lk_api
 
-    if not all([url, api_key, api_secret]):
+    if not all(creds):
         raise ValueError("Missing LiveKit credentials in .env.local")
 
+    if _lk_api is not None:
+        task = asyncio.get_running_loop().create_task(_lk_api.aclose())
+        _closing.add(task)
+        task.add_done_callback(_closing.discard)
+
+    url, api_key, api_secret = creds
+    _lk_api = api.LiveKitAPI(
+        url=url,
+        api_key=api_key,
+        api_secret=api_secret,
+    )
+    _lk_api_creds = creds
+    return _lk_api
+
+
+async def close_lk_api():
+    """Close the shared LiveKit API client, if one was created."""
+    global _lk_api, _lk_api_creds
+    if _lk_api is not None:
+        await _lk_api.aclose()
+        _lk_api = None
+        _lk_api_creds = None
+    if _closing:
+        await asyncio.gather(*_closing, return_exceptions=True)
+
+
+async def dispatch_outbound_call(
+    phone_number: str,
+    transfer_number: str | None = None,
+    *,
+    room_prefix: str = "outbound-call-",
+):
+    """
+    Dispatch an outbound call job to the LiveKit agent.
+
+    Rate-limited (429/503) responses are retried with backoff, see
+    retry_policy.
+
+    Args:
+        phone_number: Phone number to call (E.164 format, e.g., +19415180701)
+        transfer_number: Phone number for transferring to human agent (optional)
+        room_prefix: Prefix for the room name; the number (without +) follows
+    """
     # Default transfer number to Twilio phone if not provided
     if not transfer_number:
         transfer_number = os.getenv("MAX_PHONE_NUMBER", "+19412314887")
@@ -41,44 +149,111 @@ async def dispatch_outbound_call(phone_number: str, transfer_number: str | None
         "transfer_to": transfer_number
     })
 
-    print(f"Dispatching outbound call to {phone_number}...")
-    print(f"Transfer number: {transfer_number}")
-    print(f"Metadata: {metadata}")
-
-    # Create LiveKit API client
-    lk_api = api.LiveKitAPI(
-        url=url,
-        api_key=api_key,
-        api_secret=api_secret,
+    logger.info(
+        "dispatching outbound call to %s (transfer to %s)", phone_number, transfer_number
     )
+    logger.debug("metadata: %s", metadata)
+
+    # Shared LiveKit API client (kept open for further dispatches)
+    lk_api = get_lk_api()
 
     # Dispatch the job to the agent
     # This creates a room and dispatches the job to a worker
-    dispatch = await lk_api.agent_dispatch.create_dispatch(
-        api.CreateAgentDispatchRequest(
-            agent_name="outbound-caller",  # Must match agent_name in agent.py
-            room="outbound-call-" + phone_number.replace("+", ""),  # Unique room name
-            metadata=metadata,
-        )
+    request = api.CreateAgentDispatchRequest(
+        agent_name="outbound-caller",  # Must match agent_name in agent.py
+        room=f"{room_prefix}{phone_number.removeprefix('+')}",  # Unique room name
+        metadata=metadata,
+    )
+    dispatch = await retry_async(
+        lambda: lk_api.agent_dispatch.create_dispatch(request),
+        errors=api.TwirpError,
+        what=f"dispatch to {phone_number}",
+    )
+
+    logger.info(
+        "dispatched call to %s (dispatch_id=%s, room=%s, agent=%s) - "
+        "check the agent logs for call progress",
+        phone_number, dispatch.id, dispatch.room, dispatch.agent_name,
+    )
+
+
+class RateLimiter:
+    """Space out acquisitions so they happen at most `rps` times per second."""
+
+    def __init__(self, rps: float):
+        self._interval = 1.0 / rps
+        self._next = 0.0
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        """Wait until the next request is allowed to start."""
+        async with self._lock:
+            now = asyncio.get_running_loop().time()
+            if self._next > now:
+                await asyncio.sleep(self._next - now)
+                now = self._next
+            self._next = now + self._interval
+
+
+async def dispatch_many(
+    numbers: list[str],
+    transfer_number: str | None = None,
+    *,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    rps: float = DEFAULT_RPS,
+    room_prefix: str = "outbound-call-",
+) -> list:
+    """
+    Dispatch outbound calls to several numbers concurrently.
+
+    The dispatch requests overlap on the shared LiveKit client, bounded to
+    `concurrency` in flight and started at no more than `rps` per second.
+
+    Args:
+        numbers: Phone numbers to call (E.164 format)
+        transfer_number: Phone number for transferring to human agent (optional)
+        concurrency: Maximum dispatches in flight at once
+        rps: Maximum dispatches started per second
+        room_prefix: Prefix for each room name (see dispatch_outbound_call)
+
+    Returns:
+        list: One entry per number - None on success, or the exception raised
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    limiter = RateLimiter(rps)
+
+    async def dispatch(number: str):
+        async with semaphore:
+            await limiter.acquire()
+            await dispatch_outbound_call(
+                number, transfer_number, room_prefix=room_prefix
+            )
+
+    return await asyncio.gather(
+        *(dispatch(number) for number in numbers),
+        return_exceptions=True,
     )
 
-    print(f"\n✓ Call dispatched successfully!")
-    print(f"  Dispatch ID: {dispatch.id}")
-    print(f"  Room: {dispatch.room}")
-    print(f"  Agent: {dispatch.agent_name}")
-    print(f"\nThe agent will now call {phone_number}...")
-    print("Check the agent logs for call progress.")
 
-    await lk_api.aclose()
+async def _main(phone_number: str):
+    """Dispatch a single call and close the shared client afterwards."""
+    try:
+        await dispatch_outbound_call(phone_number)
+    finally:
+        await close_lk_api()
 
 
 if __name__ == "__main__":
     # Get phone number from environment or use default
     phone_to_call = os.getenv("TWILIO_TO_NUMBER", "+19415180701")
 
-    print(f"\n{'='*60}")
+    print(f"\n{BANNER_SEP}")
     print("LiveKit Outbound Caller - Make Call")
-    print(f"{'='*60}\n")
+    print(f"{BANNER_SEP}\n")
 
     # Run the dispatch
-    asyncio.run(dispatch_outbound_call(phone_to_call))
+    listener = setup_logging()
+    try:
+        asyncio.run(_main(phone_to_call))
+    finally:
+        listener.stop()
@@ -0,0 +1,62 @@
+"""
+Retry policy shared by the LiveKit dispatch and Twilio call scripts.
+
+Only rate limiting (429) and service-unavailable (503) responses are
+retried. In both cases the service turned the request away without
+processing it, so a retry can never create a second dispatch or ring a
+prospect twice.
+"""
+import time
+import random
+import asyncio
+import logging
+
+logger = logging.getLogger("retry_policy")
+
+ATTEMPTS = 3
+RETRYABLE_STATUS = frozenset({429, 503})
+
+
+def backoff_delay(attempt: int) -> float:
+    """Exponential backoff with jitter: ~0.5s, 1s, 2s, ... capped at 8s."""
+    return min(8.0, 0.5 * 2 ** attempt) + random.uniform(0, 0.5)
+
+
+def _should_retry(e: Exception, attempt: int) -> bool:
+    return e.status in RETRYABLE_STATUS and attempt < ATTEMPTS - 1
+
+
+async def retry_async(fn, *, errors, what: str):
+    """
+    Await fn() until it succeeds, retrying transient errors with backoff.
+
+    Args:
+        fn: Zero-argument callable returning the awaitable to retry
+        errors: Exception type(s) to retry on; they must have a `.status`
+        what: Description of the request, for the retry log line
+
+    Returns:
+        The result of the first successful fn() call
+    """
+    for attempt in range(ATTEMPTS):
+        try:
+            return await fn()
+        except errors as e:
+            if not _should_retry(e, attempt):
+                raise
+            delay = backoff_delay(attempt)
+            logger.warning("%s got %s, retrying in %.1fs", what, e.status, delay)
+            await asyncio.sleep(delay)
+
+
+def retry(fn, *, errors, what: str):
+    """Blocking counterpart of retry_async, for synchronous clients."""
+    for attempt in range(ATTEMPTS):
+        try:
+            return fn()
+        except errors as e:
+            if not _should_retry(e, attempt):
+                raise
+            delay = backoff_delay(attempt)
+            logger.warning("%s got %s, retrying in %.1fs", what, e.status, delay)
+            time.sleep(delay)
@@ -1,14 +1,54 @@
-"""Quick test call to Max's number"""
+"""Quick test call to Max's number
+
+Usage:
+    python test_call_max.py
+    python test_call_max.py --numbers +19415180701,+18155308498
+"""
+import argparse
 import asyncio
-from make_call import dispatch_outbound_call
+import logging
+from make_call import BANNER_SEP, close_lk_api, dispatch_many, setup_logging
+
+logger = logging.getLogger("test_call_max")
+
+DEFAULT_NUMBERS = "+19415180701"
+DEFAULT_TRANSFER = "+19415180701"
+
+
+async def main(numbers, transfer_number):
+    # All dispatches run concurrently over the one shared LiveKit client
+    try:
+        results = await dispatch_many(numbers, transfer_number)
+    finally:
+        await close_lk_api()
+
+    for number, result in zip(numbers, results):
+        if isinstance(result, Exception):
+            logger.error("dispatch to %s failed: %s", number, result)
+
 
 if __name__ == "__main__":
-    print("\n" + "="*60)
-    print("Test Call to Max: +19415180701")
-    print("="*60 + "\n")
-    
-    # Call Max's number, transfer back to Max (same number for testing)
-    asyncio.run(dispatch_outbound_call(
-        phone_number="+19415180701",
-        transfer_number="+19415180701"
-    ))
+    parser = argparse.ArgumentParser(description="Dispatch test calls")
+    parser.add_argument(
+        "--numbers",
+        default=DEFAULT_NUMBERS,
+        help="Comma-separated E.164 numbers to call (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--transfer",
+        default=DEFAULT_TRANSFER,
+        help="Number to transfer to when the prospect agrees (default: %(default)s)",
+    )
+    args = parser.parse_args()
+    numbers = [n.strip() for n in args.numbers.split(",") if n.strip()]
+
+    print(f"\n{BANNER_SEP}")
+    print(f"Test Call to Max: {', '.join(numbers)}")
+    print(f"{BANNER_SEP}\n")
+
+    # Call the numbers, transfer to Max (same number by default, for testing)
+    listener = setup_logging()
+    try:
+        asyncio.run(main(numbers, args.transfer))
+    finally:
+        listener.stop()
@@ -1,55 +1,56 @@
 """
 Test outbound call that transfers to Max
 """
-import os
-import json
 import asyncio
-from dotenv import load_dotenv
-from livekit import api
+import logging
+from make_call import (
+    BANNER_SEP,
+    close_lk_api,
+    dispatch_many,
+    dispatch_outbound_call,
+    setup_logging,
+)
+
+logger = logging.getLogger("test_call_to_max")
 
-load_dotenv(dotenv_path=".env.local")
 
 async def test_call_with_transfer(phone_to_call: str, max_phone: str):
     """Test call that transfers to Max when prospect agrees."""
-    url = os.getenv("LIVEKIT_URL")
-    api_key = os.getenv("LIVEKIT_API_KEY")
-    api_secret = os.getenv("LIVEKIT_API_SECRET")
+    # Same dispatch (and retry policy) as make_call, in a test-call- room
+    await dispatch_outbound_call(phone_to_call, max_phone, room_prefix="test-call-")
 
-    metadata = json.dumps({
-        "phone_number": phone_to_call,
-        "transfer_to": max_phone  # Max's number for transfer
-    })
 
-    print(f"\n{'='*60}")
-    print("TEST CALL - Transfer to Max")
-    print(f"{'='*60}")
-    print(f"\nCalling: {phone_to_call}")
-    print(f"Will transfer to: {max_phone}")
-    print(f"\nWhen John asks about health insurance, agree to the quote.")
-    print(f"John will say: 'Perfect! I'm going to get you over to my top agent Max...'")
-    print(f"Then he'll transfer you to Max at {max_phone}")
-    print(f"{'='*60}\n")
+async def test_calls_with_transfer(phones_to_call: list[str], max_phone: str):
+    """Dispatch test calls to several phones at once, all transferring to Max."""
+    # dispatch_many bounds the fan-out (concurrency and requests per second)
+    try:
+        results = await dispatch_many(phones_to_call, max_phone, room_prefix="test-call-")
+    finally:
+        await close_lk_api()
+    for phone, result in zip(phones_to_call, results):
+        if isinstance(result, Exception):
+            logger.error("dispatch to %s failed: %s", phone, result)
 
-    lk_api = api.LiveKitAPI(url=url, api_key=api_key, api_secret=api_secret)
-    
-    dispatch = await lk_api.agent_dispatch.create_dispatch(
-        api.CreateAgentDispatchRequest(
-            agent_name="outbound-caller",
-            room="test-call-" + phone_to_call.replace("+", ""),
-            metadata=metadata,
-        )
-    )
-
-    print(f"Call dispatched! Dispatch ID: {dispatch.id}")
-    print(f"Check agent logs for progress...")
-    
-    await lk_api.aclose()
 
 if __name__ == "__main__":
-    # YOUR PHONE (will receive the call from John)
-    your_phone = "+19415180701"
+    # YOUR PHONE(S) (will receive the call from John)
+    your_phones = ["+19415180701"]
     
     # MAX'S PHONE (where call transfers when you agree to quote)
     max_phone = "+1XXXXXXXXXX"  # ← PUT MAX'S NUMBER HERE
     
-    asyncio.run(test_call_with_transfer(your_phone, max_phone))
+    print(f"\n{BANNER_SEP}")
+    print("TEST CALL - Transfer to Max")
+    print(f"{BANNER_SEP}")
+    print(f"\nCalling: {', '.join(your_phones)}")
+    print(f"Will transfer to: {max_phone}")
+    print("\nWhen John asks about health insurance, agree to the quote.")
+    print("John will say: 'Perfect! I'm going to get you over to my top agent Max...'")
+    print(f"Then he'll transfer you to Max at {max_phone}")
+    print(f"{BANNER_SEP}\n")
+
+    listener = setup_logging()
+    try:
+        asyncio.run(test_calls_with_transfer(your_phones, max_phone))
+    finally:
+        listener.stop()
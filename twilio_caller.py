@@ -1,34 +1,83 @@
 """Twilio Outbound Caller Script"""
 import os
+import logging
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+from twilio.http.async_http_client import AsyncTwilioHttpClient
+from twilio.http.http_client import TwilioHttpClient
+from twilio.base.exceptions import TwilioRestException
 from twilio.rest import Client
+from retry_policy import retry, retry_async
 
 # Load environment variables from .env.local
 load_dotenv(dotenv_path=".env.local")
 
+logger = logging.getLogger("twilio_caller")
 
-def make_call(to_number: str, from_number: str = None, twiml_url: str = None):
+# Credentials, read once at import (see refresh_env() for rotation)
+_ACCOUNT_SID = os.getenv("TWILIO_ACCOUNT_SID")
+_AUTH_TOKEN = os.getenv("TWILIO_AUTH_TOKEN")
+_FROM_NUMBER = os.getenv("TWILIO_PHONE_NUMBER")
+
+# Twilio client shared by every call in this process, so calls reuse the
+# same keep-alive connections to api.twilio.com
+_client: Client | None = None
+
+
+def _get_client(account_sid: str, auth_token: str) -> Client:
+    """Return the shared Twilio client, creating it on first use."""
+    global _client
+    if _client is None:
+        http_client = TwilioHttpClient(pool_connections=True)
+        http_client.session.mount(
+            "https://", HTTPAdapter(pool_connections=20, pool_maxsize=50)
+        )
+        _client = Client(account_sid, auth_token, http_client=http_client)
+    return _client
+
+
+# Async counterpart of _client, for dispatching many calls concurrently.
+# Its aiohttp session is bound to the event loop it was created in.
+_async_client: Client | None = None
+
+
+def _get_async_client(account_sid: str, auth_token: str) -> Client:
     """
-    Make an outbound call using Twilio
+    Return the shared async Twilio client, creating it on first use.
 
-    Args:
-        to_number: Phone number to call (E.164 format, e.g., +19413230041)
-        from_number: Your Twilio phone number (optional, uses env var if not provided)
-        twiml_url: URL with TwiML instructions (optional, uses default demo if not provided)
+    Must be called from inside the event loop that will use the client.
+    Call close_async_client() before that loop exits.
+    """
+    global _async_client
+    if _async_client is None:
+        _async_client = Client(
+            account_sid, auth_token, http_client=AsyncTwilioHttpClient()
+        )
+    return _async_client
 
-    Returns:
-        Call SID if successful
+
+async def close_async_client():
+    """Close the shared async Twilio client, if one was created."""
+    global _async_client
+    if _async_client is not None:
+        await _async_client.http_client.close()
+        _async_client = None
+
+
+def _resolve_call_args(from_number: str | None, twiml_url: str | None):
     """
-    # Get credentials from environment variables
-    account_sid = os.getenv("TWILIO_ACCOUNT_SID")
-    auth_token = os.getenv("TWILIO_AUTH_TOKEN")
+    Fill in credentials and call defaults.
 
-    if not account_sid or not auth_token:
+    Returns:
+        tuple: (account_sid, auth_token, from_number, twiml_url)
+    """
+    # Credentials were read from the environment at import
+    if not _ACCOUNT_SID or not _AUTH_TOKEN:
         raise ValueError("TWILIO_ACCOUNT_SID and TWILIO_AUTH_TOKEN must be set in .env.local")
 
     # Use environment variable for from_number if not provided
     if not from_number:
-        from_number = os.getenv("TWILIO_PHONE_NUMBER")
+        from_number = _FROM_NUMBER
         if not from_number:
             raise ValueError("TWILIO_PHONE_NUMBER must be set in .env.local or passed as argument")
 
@@ -36,24 +85,101 @@ def make_call(to_number: str, from_number: str = None, twiml_url: str = None):
     if not twiml_url:
         twiml_url = "http://demo.twilio.com/docs/voice.xml"
 
-    # Initialize Twilio client
-    client = Client(account_sid, auth_token)
+    return _ACCOUNT_SID, _AUTH_TOKEN, from_number, twiml_url
+
+
+def refresh_env():
+    """
+    Re-read .env.local and the Twilio credentials after a rotation.
+
+    The shared sync client is dropped so the next call uses the new
+    credentials. If the async client is in use, await close_async_client()
+    first.
+    """
+    global _ACCOUNT_SID, _AUTH_TOKEN, _FROM_NUMBER, _client
+    load_dotenv(dotenv_path=".env.local", override=True)
+    _ACCOUNT_SID = os.getenv("TWILIO_ACCOUNT_SID")
+    _AUTH_TOKEN = os.getenv("TWILIO_AUTH_TOKEN")
+    _FROM_NUMBER = os.getenv("TWILIO_PHONE_NUMBER")
+    _client = None
+
+
+def make_call(to_number: str, from_number: str = None, twiml_url: str = None):
+    """
+    Make an outbound call using Twilio
 
-    # Make the call
-    call = client.calls.create(
-        url=twiml_url,
-        to=to_number,
-        from_=from_number
+    Args:
+        to_number: Phone number to call (E.164 format, e.g., +19413230041)
+        from_number: Your Twilio phone number (optional, uses env var if not provided)
+        twiml_url: URL with TwiML instructions (optional, uses default demo if not provided)
+
+    Returns:
+        Call SID if successful
+    """
+    account_sid, auth_token, from_number, twiml_url = _resolve_call_args(
+        from_number, twiml_url
+    )
+
+    # Shared Twilio client (created on the first call)
+    client = _get_client(account_sid, auth_token)
+
+    # Make the call (429/503 responses are retried, see retry_policy)
+    call = retry(
+        lambda: client.calls.create(
+            url=twiml_url,
+            to=to_number,
+            from_=from_number
+        ),
+        errors=TwilioRestException,
+        what=f"Twilio call to {to_number}",
     )
 
-    print(f"Call initiated successfully!")
-    print(f"Call SID: {call.sid}")
-    print(f"Status: {call.status}")
+    logger.info("call initiated (sid=%s, status=%s)", call.sid, call.status)
+
+    return call.sid
+
+
+async def make_call_async(to_number: str, from_number: str = None, twiml_url: str = None):
+    """
+    Make an outbound call using Twilio without blocking the event loop
+
+    Same as make_call, but runs on the shared async client so many calls can
+    be placed concurrently with asyncio.gather.
+
+    Args:
+        to_number: Phone number to call (E.164 format, e.g., +19413230041)
+        from_number: Your Twilio phone number (optional, uses env var if not provided)
+        twiml_url: URL with TwiML instructions (optional, uses default demo if not provided)
+
+    Returns:
+        Call SID if successful
+    """
+    account_sid, auth_token, from_number, twiml_url = _resolve_call_args(
+        from_number, twiml_url
+    )
+
+    # Shared async Twilio client (created on the first call in this loop)
+    client = _get_async_client(account_sid, auth_token)
+
+    # Make the call (429/503 responses are retried, see retry_policy)
+    call = await retry_async(
+        lambda: client.calls.create_async(
+            url=twiml_url,
+            to=to_number,
+            from_=from_number
+        ),
+        errors=TwilioRestException,
+        what=f"Twilio call to {to_number}",
+    )
+
+    logger.info("call initiated (sid=%s, status=%s)", call.sid, call.status)
 
     return call.sid
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s")
+
     # Example usage
     try:
         # Make a call to the specified number
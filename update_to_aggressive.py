@@ -1,16 +1,41 @@
 # Update script to change agent to aggressive sales version
+import os
 import shutil
+import tempfile
 
-# Backup current agent
-shutil.copy("agent.py", "agent.py.backup-health-insurance")
-print("✓ Backed up current agent.py")
+BACKUP = "agent.py.backup-health-insurance"
 
-# Read the aggressive sales script
-aggressive_script = open("agent_aggressive_template.txt").read()
 
-# Write it to agent.py
-with open("agent.py", "w") as f:
-    f.write(aggressive_script)
+def backup_agent():
+    """Back up the current agent.py before it is replaced."""
+    # A hard link is enough: agent.py is replaced (not rewritten in place)
+    # below, so the backup keeps the old contents.
+    if os.path.exists(BACKUP):
+        os.remove(BACKUP)
+    try:
+        os.link("agent.py", BACKUP)
+    except OSError:
+        # Filesystem without hard links - fall back to a real copy
+        shutil.copy2("agent.py", BACKUP)
+    print("✓ Backed up current agent.py")
+
+
+# Copy the aggressive sales script into a temp file next to agent.py, then
+# swap it in atomically so agent.py is never left half-written. copyfile
+# copies in the kernel (sendfile on Linux), so the template is never read
+# into Python memory. The old backup is only replaced once the new copy is
+# ready, so a failed copy leaves both files as they were.
+fd, tmp_path = tempfile.mkstemp(dir=".", prefix=".agent.py.", suffix=".tmp")
+os.close(fd)
+try:
+    shutil.copyfile("agent_aggressive_template.txt", tmp_path)
+    # mkstemp creates the file owner-only; keep agent.py's permissions
+    shutil.copymode("agent.py", tmp_path)
+    backup_agent()
+    os.replace(tmp_path, "agent.py")
+except BaseException:
+    os.unlink(tmp_path)
+    raise
 
 print("✓ Updated agent.py with aggressive sales script!")
 print("\nNext steps:")